@@ -1,9 +1,12 @@
 const {join} = require('path');
+const os = require('os');
 
 /**
  * @type {import("puppeteer").Configuration}
  */
 module.exports = {
-  cacheDirectory: join(__dirname, '.cache', 'puppeteer'),
+  // Stable per-host cache so Chromium is downloaded once per machine,
+  // not once per checkout
+  cacheDirectory: process.env.PUPPETEER_CACHE_DIR || join(os.homedir(), '.cache', 'puppeteer'),
   args: ['--no-sandbox', '--disable-setuid-sandbox'],
-};
\ No newline at end of file
+};
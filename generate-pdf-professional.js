@@ -17,19 +17,21 @@ const path = require('path');
 const fs = require('fs');
 const { pathToFileURL } = require('url');
 
-async function generatePDF() {
+async function generatePDF(sharedBrowser, resumeData) {
   const resumePath = path.resolve(__dirname, 'build', 'resume.json');
   const outputPath = path.resolve(__dirname, 'build', 'resume-professional.pdf');
 
-  console.log(`Resume JSON: ${resumePath}`);
   console.log(`Output PDF:  ${outputPath}`);
 
-  // Load resume data
-  if (!fs.existsSync(resumePath)) {
-    console.error(`✗ Resume JSON not found at: ${resumePath}`);
-    process.exit(1);
+  // Use resume data passed over stdio by the worker, falling back to the
+  // on-disk JSON in standalone CLI mode
+  let resume = resumeData;
+  if (!resume) {
+    if (!fs.existsSync(resumePath)) {
+      throw new Error(`Resume JSON not found at: ${resumePath}`);
+    }
+    resume = JSON.parse(fs.readFileSync(resumePath, 'utf-8'));
   }
-  const resume = JSON.parse(fs.readFileSync(resumePath, 'utf-8'));
 
   // Remove empty array sections so the theme components (which only check !prop instead of prop.length === 0) will return null and not render empty headers.
   for (let key in resume) {
@@ -86,8 +88,7 @@ async function generatePDF() {
   const theme = await import(pathToFileURL(distPath).href);
 
   if (typeof theme.render !== 'function') {
-    console.error('✗ Theme does not export a render() function. Exported keys:', Object.keys(theme));
-    process.exit(1);
+    throw new Error(`Theme does not export a render() function. Exported keys: ${Object.keys(theme)}`);
   }
 
   // Render HTML and point font paths to the JSON Resume CDN
@@ -110,14 +111,15 @@ async function generatePDF() {
 
   console.log('✓ HTML rendered');
 
-  // Launch Puppeteer
-  const browser = await puppeteer.launch({
-    args: ['--no-sandbox', '--disable-setuid-sandbox'],
+  // Launch Puppeteer (or reuse a browser provided by a long-lived worker)
+  const browser = sharedBrowser || await puppeteer.launch({
+    args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu', '--disable-dev-shm-usage'],
     headless: true,
   });
 
+  let page;
   try {
-    const page = await browser.newPage();
+    page = await browser.newPage();
     await page.setContent(html, { waitUntil: 'networkidle0' });
 
     // Dynamically clean up DOM structure
@@ -212,11 +214,19 @@ async function generatePDF() {
     console.log(`  File: ${outputPath}`);
     console.log(`  Size: ${(size / 1024).toFixed(1)} KB`);
   } finally {
-    await browser.close();
+    if (sharedBrowser) {
+      if (page) await page.close();
+    } else {
+      await browser.close();
+    }
   }
 }
 
-generatePDF().catch((err) => {
-  console.error('✗ PDF generation failed:', err.message);
-  process.exit(1);
-});
+module.exports = { generatePDF };
+
+if (require.main === module) {
+  generatePDF().catch((err) => {
+    console.error('✗ PDF generation failed:', err.message);
+    process.exit(1);
+  });
+}
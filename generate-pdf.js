@@ -12,21 +12,23 @@ const puppeteer = require('puppeteer');
 const path = require('path');
 const fs = require('fs');
 
-async function generatePDF() {
+async function generatePDF(sharedBrowser, resumeData) {
   const resumePath = path.resolve(__dirname, 'build', 'resume.json');
   const outputPath = path.resolve(__dirname, 'build', 'resume.pdf');
   const themePath = path.resolve(__dirname, 'node_modules', 'jsonresume-theme-stackoverflow');
 
-  console.log(`Resume JSON: ${resumePath}`);
   console.log(`Output PDF:  ${outputPath}`);
   console.log(`Theme path:  ${themePath}`);
 
-  // Load resume data
-  if (!fs.existsSync(resumePath)) {
-    console.error(`✗ Resume JSON not found at: ${resumePath}`);
-    process.exit(1);
+  // Use resume data passed over stdio by the worker, falling back to the
+  // on-disk JSON in standalone CLI mode
+  let resume = resumeData;
+  if (!resume) {
+    if (!fs.existsSync(resumePath)) {
+      throw new Error(`Resume JSON not found at: ${resumePath}`);
+    }
+    resume = JSON.parse(fs.readFileSync(resumePath, 'utf-8'));
   }
-  const resume = JSON.parse(fs.readFileSync(resumePath, 'utf-8'));
 
   // Load theme and render HTML
   const theme = require(themePath);
@@ -89,14 +91,15 @@ async function generatePDF() {
 
   console.log('✓ HTML rendered and patched');
 
-  // Launch Puppeteer
-  const browser = await puppeteer.launch({
-    args: ['--no-sandbox', '--disable-setuid-sandbox'],
+  // Launch Puppeteer (or reuse a browser provided by a long-lived worker)
+  const browser = sharedBrowser || await puppeteer.launch({
+    args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu', '--disable-dev-shm-usage'],
     headless: true,
   });
 
+  let page;
   try {
-    const page = await browser.newPage();
+    page = await browser.newPage();
     await page.setContent(html, { waitUntil: 'networkidle0' });
 
     // Handlebars has a scope bug in the projects partial: {{#if summary}} inside
@@ -168,11 +171,19 @@ async function generatePDF() {
     console.log(`  File: ${outputPath}`);
     console.log(`  Size: ${(size / 1024).toFixed(1)} KB`);
   } finally {
-    await browser.close();
+    if (sharedBrowser) {
+      if (page) await page.close();
+    } else {
+      await browser.close();
+    }
   }
 }
 
-generatePDF().catch((err) => {
-  console.error('✗ PDF generation failed:', err.message);
-  process.exit(1);
-});
\ No newline at end of file
+module.exports = { generatePDF };
+
+if (require.main === module) {
+  generatePDF().catch((err) => {
+    console.error('✗ PDF generation failed:', err.message);
+    process.exit(1);
+  });
+}
\ No newline at end of file
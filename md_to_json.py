@@ -5,36 +5,100 @@ Converts Hugo markdown content files to JSON Resume format (v1.0.0)
 """
 
 import json
+import os
 import re
+import tomllib
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 
+# Precompiled patterns (module-level so repeated invocations skip the
+# re-cache lookup on every call)
+_RE_CONFIG_KV = re.compile(r'^\s*(title|baseURL|author)\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+_RE_INFO_LIST = re.compile(r'info\s*=\s*\[([^\]]+)\]')
+_RE_QUOTED_ITEM = re.compile(r'["\']([^"\']+)["\']')
+_RE_NAME_KV = re.compile(r'name\s*=\s*["\']([^"\']+)["\']')
+_RE_URL_KV = re.compile(r'url\s*=\s*["\']([^"\']+)["\']')
+_RE_EMAIL = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_RE_LINKEDIN = re.compile(r'linkedin\.com/in/([\w-]+)')
+_RE_H2_SPLIT = re.compile(r'^##\s+([^\n]+)\n', re.MULTILINE)
+_RE_SKILL_LINE = re.compile(r'-\s+\*\*([^:]+):\*\*\s+(.+)')
+_RE_MONTH_YEAR = re.compile(r'(\w+)\s+(\d{4})', re.IGNORECASE)
+_RE_YEAR = re.compile(r'(\d{4})')
+_RE_H3_SPLIT = re.compile(r'###\s+')
+# Header/description boundary: a blank line, tolerating stray spaces or tabs
+# on it (the content style uses trailing-double-space hard breaks, so a
+# whitespace-only "blank" line is a plausible edit)
+_RE_BLANK_LINE = re.compile(r'\n[ \t]*\n')
+_RE_COMPANY_LINE = re.compile(r'\*\*([^*]+)\*\*\s*[–-]\s*(.+)')
+_RE_DATES_LINE = re.compile(r'\(\*([^)]+)\*\)')
+_RE_TRAILING_ITALIC = re.compile(r'\n\*[^*]+\*\s*$')
+_RE_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_DEGREE_INFO = re.compile(r'([^,]+)(?:,\s*(.+))?')
+_RE_THESIS = re.compile(r'Thesis:\s*([^\n]+)', re.IGNORECASE)
+_RE_PROJECT = re.compile(r'##\s+([^\n]+)\n\*\*Technologies:\*\*\s*([^\n]+)\n\n?\*\*Descri[pt]tions?:\*\*\s*((?:.|\n)*?(?=\n##|\n---|\Z))')
+_RE_PROJECT_TITLE = re.compile(r'([^:\[]+)(?::\s*\[([^\]]+)\])?')
+# One alternation covers both URL shapes: group 1 is a View on/Demo link,
+# group 2 a plain markdown-link URL kept as fallback
+_RE_URL = re.compile(r'\[(?:View on [^\]]+|Demo)\]\(([^)]+)\)|\]\((https?://[^)]+)\)')
+# Fused link cleanup: the View on/Demo branch (dropped) must come before the
+# generic link branch (unwrapped to its text). The bold strip stays a
+# separate pass so nested forms like **[text](url)** still unwrap fully
+_RE_MD_CLEAN = re.compile(r'\[(?:View on [^\]]+|Demo)\]\([^)]+\)|\[([^\]]+)\]\([^)]+\)')
+_RE_PIPES = re.compile(r'\s*\|\s*')
+_RE_CERT_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_ISSUED = re.compile(r'\*Issued\s+([^*]+)\*')
+_RE_SUMMARY = re.compile(r'([^\n]+(?:\n(?!##)[^\n]+)*)')
+
+def _label_value(content: str, label: str) -> str:
+    """Return the text following a fixed '**Label:**' marker, lstripped.
+
+    Plain substring search; the contact labels are fixed literals, so there
+    is no need to pay for a regex scan.
+    """
+    _, found, rest = content.partition(label)
+    return rest.lstrip() if found else ''
+
+
+def _leading_run(text: str, predicate) -> str:
+    """Return the longest prefix of text whose characters satisfy predicate"""
+    for i, ch in enumerate(text):
+        if not predicate(ch):
+            return text[:i]
+    return text
+
+
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+_META = {
+    "version": "v1.0.0",
+    "canonical": "https://github.com/jsonresume/resume-schema/blob/v1.0.0/schema.json"
+}
+
+
 class MarkdownToJsonConverter:
     """Converts markdown content files to JSON Resume format"""
-    
+
+    __slots__ = ('content_dir', 'hugo_config', 'resume_data', '_md_cache')
+
     def __init__(self, content_dir: str = "content", hugo_config: str = "hugo.toml"):
         self.content_dir = Path(content_dir)
         self.hugo_config = Path(hugo_config)
-        self.resume_data = {
-            "basics": {},
-            "work": [],
-            "education": [],
-            "skills": [],
-            "projects": [],
-            "volunteer": [],
-            "awards": [],
-            "certificates": [],
-            "publications": [],
-            "languages": [],
-            "interests": [],
-            "references": [],
-            "meta": {
-                "version": "v1.0.0",
-                "canonical": "https://github.com/jsonresume/resume-schema/blob/v1.0.0/schema.json"
-            }
-        }
+        self._md_cache = {}
+        # Assembled by build_resume; instantiating the converter stays cheap
+        self.resume_data = None
     
+    def _read_md(self, name: str) -> Optional[str]:
+        """Read a content file once per converter, caching by name"""
+        if name not in self._md_cache:
+            path = self.content_dir / name
+            self._md_cache[name] = path.read_text(encoding='utf-8') if path.exists() else None
+        return self._md_cache[name]
+
     def parse_hugo_config(self) -> Dict[str, Any]:
         """Parse hugo.toml for basic information"""
         config_data = {}
@@ -43,36 +107,42 @@ class MarkdownToJsonConverter:
         
         content = self.hugo_config.read_text(encoding='utf-8')
         
-        # Extract basic info
-        if match := re.search(r'title\s*=\s*["\']([^"\']+)["\']', content):
-            config_data['name'] = match.group(1)
-        
-        if match := re.search(r'baseURL\s*=\s*["\']([^"\']+)["\']', content):
-            config_data['url'] = match.group(1).rstrip('/')
-        
-        # Extract author info
-        if match := re.search(r'author\s*=\s*["\']([^"\']+)["\']', content):
-            config_data['author'] = match.group(1)
-        
-        if match := re.search(r'info\s*=\s*\[([^\]]+)\]', content):
+        # Extract basic info: one combined scan picks up title, baseURL and
+        # author instead of three separate passes over the file. A cheap
+        # substring check gates each regex so configs without the keys never
+        # pay for a full pattern scan
+        key_map = {'title': 'name', 'baseURL': 'url', 'author': 'author'}
+        if 'title' in content or 'baseURL' in content or 'author' in content:
+            for match in _RE_CONFIG_KV.finditer(content):
+                key, value = match.groups()
+                target = key_map[key]
+                if target not in config_data:
+                    config_data[target] = value.rstrip('/') if key == 'baseURL' else value
+
+        if 'info' in content and (match := _RE_INFO_LIST.search(content)):
             info_content = match.group(1)
-            info_items = re.findall(r'["\']([^"\']+)["\']', info_content)
+            info_items = _RE_QUOTED_ITEM.findall(info_content)
             if info_items:
                 config_data['label'] = info_items[0]
-        
+
         # Extract social profiles
+        if '[[params.social]]' not in content:
+            config_data['profiles'] = []
+            return config_data
+
+        # The block header is a fixed literal, so a plain split yields each
+        # block body directly (each slice runs to the next header or EOF,
+        # exactly like the old lazy DOTALL pattern, minus the regex engine)
         profiles = []
-        social_blocks = re.finditer(r'\[\[params\.social\]\](.*?)(?=\[\[params\.social\]\]|\Z)', content, re.DOTALL)
-        for block in social_blocks:
-            block_content = block.group(1)
+        for block_content in content.split('[[params.social]]')[1:]:
             profile = {}
-            if match := re.search(r'name\s*=\s*["\']([^"\']+)["\']', block_content):
+            if match := _RE_NAME_KV.search(block_content):
                 network_name = match.group(1)
                 # Exclude 'Github' profile
                 if network_name.lower() == 'github':
                     continue
                 profile['network'] = network_name
-            if match := re.search(r'url\s*=\s*["\']([^"\']+)["\']', block_content):
+            if match := _RE_URL_KV.search(block_content):
                 url = match.group(1)
                 profile['url'] = url
                 # Extract username from URL
@@ -85,25 +155,29 @@ class MarkdownToJsonConverter:
         config_data['profiles'] = profiles
         return config_data
     
-    def parse_front_matter(self, content: str) -> tuple[Dict[str, str], str]:
+    def parse_front_matter(self, content: str) -> tuple[Dict[str, Any], str]:
         """Extract TOML front matter and return it with remaining content"""
         front_matter = {}
         body = content
-        
-        if content.startswith('+++'):
+
+        # Empty files and files without front matter fall through untouched
+        if content and content.startswith('+++'):
             parts = content.split('+++', 2)
             if len(parts) >= 3:
                 front_matter_text = parts[1].strip()
                 body = parts[2].strip()
-                
-                # Parse simple TOML key-value pairs
-                for line in front_matter_text.split('\n'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip().strip('"\'')
-                        front_matter[key] = value
-        
+
+                try:
+                    front_matter = tomllib.loads(front_matter_text)
+                except tomllib.TOMLDecodeError:
+                    # Fall back to naive key=value parsing for malformed TOML
+                    for line in front_matter_text.split('\n'):
+                        if '=' in line:
+                            key, value = line.split('=', 1)
+                            key = key.strip()
+                            value = value.strip().strip('"\'')
+                            front_matter[key] = value
+
         return front_matter, body
     
     def parse_contact_info(self) -> Dict[str, Any]:
@@ -111,70 +185,64 @@ class MarkdownToJsonConverter:
         contact_info = {}
         
         # Parse contact.md
-        contact_file = self.content_dir / "contact.md"
-        if contact_file.exists():
-            content = contact_file.read_text(encoding='utf-8')
+        content = self._read_md("contact.md")
+        if content is not None:
             
-            # Extract email
-            if match := re.search(r'saleh\.mehdikhani\s*\[at\]\s*gmail\s*dot\s*com', content, re.IGNORECASE):
+            # Extract email (the obfuscated form is a fixed literal, so a
+            # substring check beats a case-insensitive regex scan)
+            lowered = content.lower()
+            if 'saleh.mehdikhani' in lowered and '[at]' in lowered:
                 contact_info['email'] = 'saleh.mehdikhani@gmail.com'
-            elif match := re.search(r'[\w\.-]+@[\w\.-]+\.\w+', content):
+            elif match := _RE_EMAIL.search(content):
                 contact_info['email'] = match.group(0)
             
             # Extract LinkedIn
-            if match := re.search(r'linkedin\.com/in/([\w-]+)', content):
+            if match := _RE_LINKEDIN.search(content):
                 linkedin_username = match.group(1)
                 contact_info['linkedin'] = f'https://www.linkedin.com/in/{linkedin_username}/'
         
         # Parse other.md
-        other_file = self.content_dir / "other.md"
-        if other_file.exists():
-            content = other_file.read_text(encoding='utf-8')
+        content = self._read_md("other.md")
+        if content is not None:
             
-            # Extract phone
-            if match := re.search(r'\*\*Phone:\*\*\s*(\d+)', content):
-                phone = match.group(1).strip()
+            # Extract phone: the run of digits after the label
+            if phone := _leading_run(_label_value(content, '**Phone:**'), str.isdigit):
                 # Format Finnish phone number
                 if not phone.startswith('+'):
                     phone = '+358 ' + phone.lstrip('0')
                 contact_info['phone'] = phone
-            
-            # Extract city
-            if match := re.search(r'\*\*City:\*\*\s*(\w+)', content):
-                contact_info['city'] = match.group(1)
-            
+
+            # Extract city (single word after the label)
+            if city := _leading_run(_label_value(content, '**City:**'), str.isalnum):
+                contact_info['city'] = city
+
             # Extract country
-            if match := re.search(r'\*\*Country:\*\*\s*(\w+)', content):
-                contact_info['country'] = match.group(1)
+            if country := _leading_run(_label_value(content, '**Country:**'), str.isalnum):
+                contact_info['country'] = country
 
-            # Extract website from other.md
-            if match := re.search(r'\*\*Website:\*\*\s*(https?://[^\s]+)', content):
-                contact_info['website'] = match.group(1)
+            # Extract website from other.md (first whitespace-delimited token)
+            website = _label_value(content, '**Website:**').split(None, 1)
+            if website and website[0].startswith(('http://', 'https://')):
+                contact_info['website'] = website[0]
         
         return contact_info
     
-    def parse_skills(self, content: str) -> List[Dict[str, Any]]:
-        """Parse skills section from markdown content"""
+    def parse_skills(self, skills_content: str) -> List[Dict[str, Any]]:
+        """Parse the Skills section content"""
         skills = []
-        
-        # Find skills section
-        skills_match = re.search(r'##\s+Skills\s*\n(.*?)(?=\n##\s+[^#]|\n---|\Z)', content, re.DOTALL)
-        if not skills_match:
+        if not skills_content:
             return skills
-        
-        skills_content = skills_match.group(1)
-        
+
         # Parse each skill line: - **Category:** item1, item2, item3
-        skill_lines = re.finditer(r'-\s+\*\*([^:]+):\*\*\s+(.+)', skills_content)
+        skill_lines = _RE_SKILL_LINE.finditer(skills_content)
         for match in skill_lines:
-            category = match.group(1).strip()
-            items = match.group(2).strip()
-            keywords = [item.strip() for item in items.split(',')]
+            category, items = match.groups()
+            keywords = [item.strip() for item in items.strip().split(',')]
             skills.append({
-                "name": category,
+                "name": category.strip(),
                 "keywords": keywords
             })
-        
+
         return skills
     
     def parse_date(self, date_str: str) -> tuple[Optional[str], Optional[str]]:
@@ -198,47 +266,51 @@ class MarkdownToJsonConverter:
     def _convert_date(self, date_str: str) -> Optional[str]:
         """Convert various date formats to ISO format"""
         date_str = date_str.strip()
-        
-        # Month Year format (e.g., "Sep 2020", "May 2015")
-        month_map = {
-            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-            'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-            'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-        }
-        
-        if match := re.match(r'(\w+)\s+(\d{4})', date_str, re.IGNORECASE):
+
+        # Fast path: the common "Sep 2020" and "2011" shapes need no regex
+        parts = date_str.split()
+        if (len(parts) == 2 and parts[0].isalpha()
+                and len(parts[1]) >= 4 and parts[1][:4].isdigit()):
+            if month := _MONTH_MAP.get(parts[0][:3].lower()):
+                return f"{parts[1][:4]}-{month}"
+        if len(date_str) >= 4 and date_str[:4].isdigit():
+            return date_str[:4]
+
+        # Fallback for oddball inputs: Month Year (e.g., "Sep 2020")
+        if match := _RE_MONTH_YEAR.match(date_str):
             month_name = match.group(1).lower()[:3]
             year = match.group(2)
-            if month_name in month_map:
-                return f"{year}-{month_map[month_name]}"
-        
+            if month_name in _MONTH_MAP:
+                return f"{year}-{_MONTH_MAP[month_name]}"
+
         # Year only format (e.g., "2011", "2013")
-        if match := re.match(r'(\d{4})', date_str):
+        if match := _RE_YEAR.match(date_str):
             return match.group(1)
-        
+
         return None
     
-    def parse_work_experience(self, content: str) -> List[Dict[str, Any]]:
-        """Parse work experience section from markdown content"""
+    def parse_work_experience(self, exp_content: str) -> List[Dict[str, Any]]:
+        """Parse the Experience section content"""
         work = []
-        
-        # Find experience section - include content until next ## heading or end
-        exp_match = re.search(r'##\s+Experience\s*\n(.*?)(?=\n##\s+[^#]|\Z)', content, re.DOTALL)
-        if not exp_match:
+        if not exp_content:
             return work
-        
-        exp_content = exp_match.group(1)
-        # Remove horizontal rules (---) as they're just separators
-        exp_content = re.sub(r'\n---\n', '\n\n', exp_content)
+
+        # Remove horizontal rules (---) as they're just separators; a fixed
+        # string swap, so str.replace instead of re.sub
+        exp_content = exp_content.replace('\n---\n', '\n\n')
         
         # Split by ### to get individual job entries
-        job_sections = re.split(r'###\s+', exp_content)
+        job_sections = _RE_H3_SPLIT.split(exp_content)
         
         for section in job_sections:
             if not section.strip():
                 continue
-            # Parse each job entry
-            lines = section.strip().split('\n')
+            # Split the 3-line header from the description at the first blank
+            # line in one linear pass instead of a per-line flag loop
+            parts = _RE_BLANK_LINE.split(section.strip(), 1)
+            head = parts[0]
+            description = parts[1] if len(parts) > 1 else ''
+            lines = head.split('\n')
             if len(lines) < 3:
                 continue
             
@@ -246,33 +318,25 @@ class MarkdownToJsonConverter:
             
             # Parse company and location line: **Company** – Location
             company_line = lines[1] if len(lines) > 1 else ""
-            company_match = re.match(r'\*\*([^*]+)\*\*\s*[–-]\s*(.+)', company_line)
+            company_match = _RE_COMPANY_LINE.match(company_line)
             if not company_match:
                 continue
             
-            company = company_match.group(1).strip()
-            location = company_match.group(2).strip()
+            # Bind both captures in one call instead of two group() lookups
+            company, location = company_match.groups()
+            company = company.strip()
+            location = location.strip()
             
             # Parse dates line: (*Date – Date*)
             dates_line = lines[2] if len(lines) > 2 else ""
-            dates_match = re.match(r'\(\*([^)]+)\*\)', dates_line)
+            dates_match = _RE_DATES_LINE.match(dates_line)
             if not dates_match:
                 continue
             
             dates = dates_match.group(1).strip()
-            
-            # Get description (everything after the empty line)
-            description_lines = []
-            found_empty = False
-            for line in lines[3:]:
-                if not line.strip() and not found_empty:
-                    found_empty = True
-                    continue
-                if found_empty:
-                    description_lines.append(line)
-            
-            description = '\n'.join(description_lines).strip()
-            
+
+            description = description.strip()
+
             start_date, end_date = self.parse_date(dates)
             
             work_entry = {
@@ -291,28 +355,28 @@ class MarkdownToJsonConverter:
         
         return work
     
-    def parse_education(self, content: str) -> List[Dict[str, Any]]:
-        """Parse education section from markdown content"""
+    def parse_education(self, edu_content: str) -> List[Dict[str, Any]]:
+        """Parse the Education section content"""
         education = []
-        
-        # Find education section - include content until next ## heading or end
-        edu_match = re.search(r'##\s+Education\s*\n(.*?)(?=\n##\s+[^#]|\Z)', content, re.DOTALL)
-        if not edu_match:
+        if not edu_content:
             return education
-        
-        edu_content = edu_match.group(1)
+
         # Remove horizontal rules (---) and italic text at the end
-        edu_content = re.sub(r'\n---\n', '\n\n', edu_content)
-        edu_content = re.sub(r'\n\*[^*]+\*\s*$', '', edu_content)
+        edu_content = edu_content.replace('\n---\n', '\n\n')
+        edu_content = _RE_TRAILING_ITALIC.sub('', edu_content)
         
         # Split by ### to get individual education entries
-        edu_sections = re.split(r'###\s+', edu_content)
+        edu_sections = _RE_H3_SPLIT.split(edu_content)
         
         for section in edu_sections:
             if not section.strip():
                 continue
-            # Parse each education entry
-            lines = section.strip().split('\n')
+            # Split the 3-line header from the description at the first blank
+            # line in one linear pass instead of a per-line flag loop
+            parts = _RE_BLANK_LINE.split(section.strip(), 1)
+            head = parts[0]
+            desc_block = parts[1] if len(parts) > 1 else ''
+            lines = head.split('\n')
             if len(lines) < 3:
                 continue
             
@@ -320,7 +384,7 @@ class MarkdownToJsonConverter:
             
             # Parse institution line: **Institution**
             institution_line = lines[1] if len(lines) > 1 else ""
-            institution_match = re.match(r'\*\*([^*]+)\*\*', institution_line)
+            institution_match = _RE_BOLD.match(institution_line)
             if not institution_match:
                 continue
             
@@ -328,28 +392,25 @@ class MarkdownToJsonConverter:
             
             # Parse dates line: (*Date – Date*)
             dates_line = lines[2] if len(lines) > 2 else ""
-            dates_match = re.match(r'\(\*([^)]+)\*\)', dates_line)
+            dates_match = _RE_DATES_LINE.match(dates_line)
             if not dates_match:
                 continue
             
             dates = dates_match.group(1).strip()
-            
-            # Get description (everything after the empty line)
-            description_lines = []
-            found_empty = False
-            for line in lines[3:]:
-                if not line.strip() and not found_empty:
-                    found_empty = True
-                    continue
-                if found_empty and line.strip():
-                    description_lines.append(line)
-            
-            description = '\n'.join(description_lines).strip()
+
+            # Keep only non-blank description lines
+            description = '\n'.join(
+                line for line in desc_block.split('\n') if line.strip()
+            ).strip()
             
             # Parse degree info (e.g., "Master of Science (MS), Computer Architecture")
-            degree_match = re.match(r'([^,]+)(?:,\s*(.+))?', degree_info)
-            study_type = degree_match.group(1).strip() if degree_match else degree_info
-            area = degree_match.group(2).strip() if degree_match and degree_match.group(2) else ""
+            degree_match = _RE_DEGREE_INFO.match(degree_info)
+            if degree_match:
+                study_type, area = degree_match.groups()
+                study_type = study_type.strip()
+                area = area.strip() if area else ""
+            else:
+                study_type, area = degree_info, ""
             
             start_date, end_date = self.parse_date(dates)
             
@@ -365,7 +426,7 @@ class MarkdownToJsonConverter:
             
             # Extract thesis information if present
             if 'thesis' in description.lower():
-                thesis_match = re.search(r'Thesis:\s*([^\n]+)', description, re.IGNORECASE)
+                thesis_match = _RE_THESIS.search(description)
                 if thesis_match:
                     edu_entry["courses"].append(thesis_match.group(1).strip())
             
@@ -377,51 +438,59 @@ class MarkdownToJsonConverter:
         """Parse projects from projects.md"""
         projects = []
         
-        projects_file = self.content_dir / "projects.md"
-        if not projects_file.exists():
+        content = self._read_md("projects.md")
+        if content is None:
             return projects
-        
-        content = projects_file.read_text(encoding='utf-8')
+
         _, body = self.parse_front_matter(content)
         
-        # Allow optional blank line between Technologies and Description lines
-        project_pattern = r'##\s+([^\n]+)\n\*\*Technologies:\*\*\s*([^\n]+)\n\n?\*\*Descri[pt]tions?:\*\*\s*((?:.|\n)*?(?=\n##|\n---|\Z))'
-        projects_matches = re.finditer(project_pattern, body)
+        # _RE_PROJECT allows an optional blank line between Technologies and
+        # Description lines
+        projects_matches = _RE_PROJECT.finditer(body)
         
         for match in projects_matches:
-            title_line = match.group(1).strip()
-            technologies = match.group(2).strip()
-            description = match.group(3).strip()
-            
+            title_line, technologies, description = match.groups()
+            title_line = title_line.strip()
+            description = description.strip()
+
             # Parse title and entity (e.g., "Project Name: [Entity]")
-            title_match = re.match(r'([^:\[]+)(?::\s*\[([^\]]+)\])?', title_line)
-            name = title_match.group(1).strip() if title_match else title_line
-            entity = title_match.group(2).strip() if title_match and title_match.group(2) else ""
+            title_match = _RE_PROJECT_TITLE.match(title_line)
+            if title_match:
+                name, entity = title_match.groups()
+                name = name.strip()
+                entity = entity.strip() if entity else ""
+            else:
+                name, entity = title_line, ""
             
             # Parse technologies
-            tech_list = [tech.strip() for tech in technologies.split(',')]
+            tech_list = [tech.strip() for tech in technologies.strip().split(',')]
             
-            # Extract URLs from description
+            # Extract URLs from the description in a single pass: the first
+            # View on/Demo link wins, otherwise the first plain markdown-link
+            # URL is used as fallback
             url = ""
-            # Look for View on or Demo links
-            urls = re.findall(r'\[(?:View on [^\]]+|Demo)\]\(([^)]+)\)', description)
-            if urls:
-                url = urls[0]  # Use first URL as primary
-            # Also check for plain URLs in markdown links
-            if not url:
-                plain_urls = re.findall(r'\]\((https?://[^)]+)\)', description)
-                if plain_urls:
-                    url = plain_urls[0]
+            plain_url = ""
+            for url_match in _RE_URL.finditer(description):
+                link_url, fallback_url = url_match.groups()
+                if link_url:
+                    url = link_url
+                    break
+                if not plain_url:
+                    plain_url = fallback_url
+            url = url or plain_url
             
             # Clean description:
-            # 1. Remove specific project links (View on..., Demo) as they are handled by the 'url' field
-            clean_desc = re.sub(r'\[(?:View on [^\]]+|Demo)\]\([^)]+\)', '', description)
-            # 2. Remove remaining markdown links but keep text: [Text](URL) -> Text
-            clean_desc = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', clean_desc)
-            # 3. Remove bold markers
-            clean_desc = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_desc)
-            # 4. Clean up any leftover pipes or whitespace from removed links
-            clean_desc = re.sub(r'\s*\|\s*', ' ', clean_desc)
+            # - drop project links (View on..., Demo) as they are handled by
+            #   the 'url' field, and unwrap remaining markdown links
+            #   [Text](URL) -> Text, in one fused pass
+            # - then remove bold markers, after unwrapping so bold inside or
+            #   around a link is still stripped
+            clean_desc = _RE_MD_CLEAN.sub(
+                lambda m: m.group(1) or '', description
+            )
+            clean_desc = _RE_BOLD.sub(r'\1', clean_desc)
+            # Clean up any leftover pipes or whitespace from removed links
+            clean_desc = _RE_PIPES.sub(' ', clean_desc)
             clean_desc = clean_desc.strip()
 
             # Separate a main description from a bulleted list
@@ -452,19 +521,18 @@ class MarkdownToJsonConverter:
         
         return projects
 
-    def parse_certificates(self, content: str) -> List[Dict[str, Any]]:
-        """Parse certificates from markdown content"""
+    def parse_certificates(self, cert_content: str) -> List[Dict[str, Any]]:
+        """Parse the Certificates section content"""
         certificates = []
-        
-        # Find certificates section
-        cert_match = re.search(r'##\s+Certificates\s*\n(.*?)(?=\n##\s+[^#]|\n---|\Z)', content, re.DOTALL)
-        if not cert_match:
+        if not cert_content:
             return certificates
-        
-        cert_content = cert_match.group(1)
-        
+
+        # The heading split already bounded the slice at the next ## section;
+        # a trailing horizontal rule still ends the entries
+        cert_content = cert_content.partition('\n---')[0]
+
         # Split by ### to get individual certificate entries
-        cert_sections = re.split(r'###\s+', cert_content)
+        cert_sections = _RE_H3_SPLIT.split(cert_content)
         
         for section in cert_sections:
             if not section.strip():
@@ -477,23 +545,24 @@ class MarkdownToJsonConverter:
             name_line = lines[0]
             # Extract URL if present in name: ### [Name](URL)
             url = ""
-            if match := re.search(r'\[([^\]]+)\]\(([^)]+)\)', name_line):
-                name = match.group(1).strip()
-                url = match.group(2).strip()
+            if match := _RE_CERT_LINK.search(name_line):
+                name, url = match.groups()
+                name = name.strip()
+                url = url.strip()
             else:
                 name = name_line.strip()
             
             # Parse issuer: **Issuer**
             issuer = ""
             if len(lines) > 1:
-                issuer_match = re.search(r'\*\*([^*]+)\*\*', lines[1])
+                issuer_match = _RE_BOLD.search(lines[1])
                 if issuer_match:
                     issuer = issuer_match.group(1).strip()
             
             # Parse date: *Issued Month Year*
             date = ""
             for line in lines[1:]:
-                if match := re.search(r'\*Issued\s+([^*]+)\*', line):
+                if match := _RE_ISSUED.search(line):
                     date_str = match.group(1).strip()
                     date = self._convert_date(date_str) or ""
                     break
@@ -517,7 +586,8 @@ class MarkdownToJsonConverter:
         contact_info = self.parse_contact_info()
         
         # Build basics section
-        self.resume_data["basics"] = {
+        profiles = config_data.get('profiles', [])
+        basics = {
             "name": config_data.get('name', 'Saleh Mehdikhani'),
             "label": config_data.get('label', 'Senior System Software Developer'),
             "email": contact_info.get('email', ''),
@@ -529,7 +599,7 @@ class MarkdownToJsonConverter:
                 "countryCode": "FI",
                 "region": contact_info.get('country', 'Finland')
             },
-            "profiles": config_data.get('profiles', [])
+            "profiles": profiles
         }
 
         # Add LinkedIn to profiles if found in contact info
@@ -540,39 +610,82 @@ class MarkdownToJsonConverter:
                 "url": contact_info.get('linkedin', '')
             }
             # Check if LinkedIn not already in profiles
-            if not any(p.get('network') == 'LinkedIn' for p in self.resume_data["basics"]["profiles"]):
-                self.resume_data["basics"]["profiles"].append(linkedin_profile)
-        
+            if not any(p.get('network') == 'LinkedIn' for p in profiles):
+                profiles.append(linkedin_profile)
+
         # Parse about.md for summary, skills, experience, and education
-        about_file = self.content_dir / "about.md"
-        if about_file.exists():
-            content = about_file.read_text(encoding='utf-8')
+        skills, work, education, certificates = [], [], [], []
+        content = self._read_md("about.md")
+        if content is not None:
             _, body = self.parse_front_matter(content)
-            
+
             # Extract summary (first paragraph after front matter)
-            summary_match = re.match(r'([^\n]+(?:\n(?!##)[^\n]+)*)', body.strip())
+            summary_match = _RE_SUMMARY.match(body.strip())
             if summary_match:
-                self.resume_data["basics"]["summary"] = summary_match.group(1).strip()
-            
-            # Parse sections
-            self.resume_data["skills"] = self.parse_skills(body)
-            self.resume_data["work"] = self.parse_work_experience(body)
-            self.resume_data["education"] = self.parse_education(body)
-            self.resume_data["certificates"] = self.parse_certificates(body)
-        
-        # Parse projects
-        self.resume_data["projects"] = self.parse_projects()
-        
+                basics["summary"] = summary_match.group(1).strip()
+
+            # Split the body into ## sections once with a single linear
+            # MULTILINE split (the old lazy DOTALL pattern could scan
+            # quadratically when a section lacked a terminating heading),
+            # then hand each parser its own slice. split yields
+            # [prefix, title1, body1, title2, body2, ...]
+            heads = _RE_H2_SPLIT.split(body)
+            sections = {
+                title.strip(): section_body
+                for title, section_body in zip(heads[1::2], heads[2::2])
+            }
+            skills = self.parse_skills(sections.get('Skills', ''))
+            work = self.parse_work_experience(sections.get('Experience', ''))
+            education = self.parse_education(sections.get('Education', ''))
+            certificates = self.parse_certificates(sections.get('Certificates', ''))
+
+        # Assemble the resume in one expression from the parsed pieces; the
+        # sections this converter never fills stay empty lists per the schema
+        self.resume_data = {
+            "basics": basics,
+            "work": work,
+            "education": education,
+            "skills": skills,
+            "projects": self.parse_projects(),
+            "volunteer": [],
+            "awards": [],
+            "certificates": certificates,
+            "publications": [],
+            "languages": [],
+            "interests": [],
+            "references": [],
+            "meta": _META
+        }
+
         return self.resume_data
     
     def save_json(self, output_path: str):
-        """Save resume data to JSON file"""
+        """Save resume data to JSON file atomically (temp file + os.replace)"""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         try:
-            with output_file.open('w', encoding='utf-8') as f:
-                json.dump(self.resume_data, f, indent=2, ensure_ascii=False)
+            # Serialize with orjson when available (C-speed pretty printer),
+            # falling back to the stdlib encoder otherwise
+            try:
+                import orjson
+                payload = orjson.dumps(self.resume_data, option=orjson.OPT_INDENT_2)
+            except ImportError:
+                payload = json.dumps(
+                    self.resume_data, indent=2, ensure_ascii=False
+                ).encode('utf-8')
+
+            # Leave the file (and its mtime) untouched when nothing changed,
+            # so downstream steps can cheaply detect a no-op rebuild
+            if output_file.exists() and output_file.read_bytes() == payload:
+                print(f"✓ Resume JSON unchanged: {output_file}")
+                return
+
+            # Write to a temp file and rename, so a crash mid-write can never
+            # leave a torn resume.json behind
+            tmp_file = output_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, output_file)
             print(f"✓ Resume JSON saved to: {output_file}")
         except PermissionError as e:
             print(f"✗ Permission error writing to {output_file}: {e}")
@@ -583,18 +696,25 @@ class MarkdownToJsonConverter:
             raise
 
 
+def convert(output_path: str = "build/resume.json") -> Dict[str, Any]:
+    """Run the full conversion and return the resume data.
+
+    Importable entry point so callers (e.g. build_resume.py) can run the
+    conversion in-process instead of spawning a fresh interpreter.
+    """
+    converter = MarkdownToJsonConverter()
+    resume_data = converter.build_resume()
+    converter.save_json(output_path)
+    return resume_data
+
+
 def main():
     """Main execution function"""
     print("Converting Markdown to JSON Resume format...")
     print("-" * 50)
-    
-    converter = MarkdownToJsonConverter()
-    resume_data = converter.build_resume()
-    
-    # Save to build directory
-    output_path = "build/resume.json"
-    converter.save_json(output_path)
-    
+
+    resume_data = convert()
+
     print("-" * 50)
     print(f"✓ Conversion complete!")
     print(f"  - Basics: {resume_data['basics']['name']}")
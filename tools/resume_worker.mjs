@@ -0,0 +1,90 @@
+#!/usr/bin/env node
+
+/**
+ * tools/resume_worker.mjs
+ * Long-lived PDF render worker.
+ *
+ * Launches Puppeteer's Chromium once and then serves render jobs over
+ * stdio, so repeated builds (and the two theme renders within a single
+ * build) amortize Node startup, theme require(), and browser launch.
+ *
+ * Protocol (newline-delimited JSON):
+ *   stdin:  {"id": 1, "theme": "stackoverflow" | "professional"}
+ *   stdout: {"id": 1, "ok": true} or {"id": 1, "ok": false, "error": "..."}
+ *
+ * Human-readable logs from the render scripts go to stderr so stdout
+ * stays a clean protocol channel.
+ */
+
+import readline from 'readline';
+import { createRequire } from 'module';
+
+const require = createRequire(import.meta.url);
+const puppeteer = require('puppeteer');
+const { generatePDF: renderStackoverflow } = require('../generate-pdf.js');
+const { generatePDF: renderProfessional } = require('../generate-pdf-professional.js');
+
+// The render scripts log progress with console.log; route that to stderr
+// so it cannot corrupt the stdout reply stream.
+console.log = console.error;
+
+const renderers = {
+  stackoverflow: renderStackoverflow,
+  professional: renderProfessional,
+};
+
+function reply(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+const browser = await puppeteer.launch({
+  args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-gpu', '--disable-dev-shm-usage'],
+  headless: true,
+});
+
+let pending = 0;
+let closing = false;
+
+async function handleJob(job) {
+  pending++;
+  try {
+    const render = renderers[job.theme];
+    if (!render) {
+      throw new Error(`Unknown theme: ${job.theme}`);
+    }
+    // Each render gets its own copy: the professional script mutates the
+    // resume object in place while preprocessing it for its theme
+    await render(browser, job.resume ? structuredClone(job.resume) : undefined);
+    reply({ id: job.id, ok: true });
+  } catch (err) {
+    reply({ id: job.id, ok: false, error: err.message });
+  } finally {
+    pending--;
+    if (closing && pending === 0) await shutdown();
+  }
+}
+
+async function shutdown() {
+  await browser.close();
+  process.exit(0);
+}
+
+const rl = readline.createInterface({ input: process.stdin });
+
+rl.on('line', (line) => {
+  if (!line.trim()) return;
+  let job;
+  try {
+    job = JSON.parse(line);
+  } catch (err) {
+    reply({ id: null, ok: false, error: `Bad job line: ${err.message}` });
+    return;
+  }
+  // Jobs run concurrently; each render gets its own page in the shared browser
+  handleJob(job);
+});
+
+rl.on('close', () => {
+  closing = true;
+  if (pending === 0) shutdown();
+});